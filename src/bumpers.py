@@ -0,0 +1,1224 @@
+# -*- coding: utf-8 -*-
+"""
+Delphi 版本号升级器
+
+解析并修改 .res 与 .dproj 文件中的版本号。命令行入口见 version_bumper.py，
+它在解析完参数后才导入本模块，使 --help 等路径无需加载这部分代码。
+"""
+
+import os
+import io
+import sys
+import re
+import struct
+import shutil
+import contextlib
+import functools
+import itertools
+from dataclasses import dataclass
+from typing import Optional, List, Tuple
+
+
+# ANSI 颜色代码
+class Colors:
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    CYAN = '\033[96m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    ENDC = '\033[0m'
+    BOLD = '\033[1m'
+
+
+# 颜色后缀通过默认参数绑定，避免每次调用都查找 Colors 属性
+_COLOR_END = Colors.ENDC + '\n'
+
+
+def _emit(msg: str, color: str = Colors.ENDC, _end: str = _COLOR_END):
+    """输出一行彩色文本：直接 sys.stdout.write，不经过 print() 的参数处理
+
+    写入的是 str 而非 stdout.buffer 的字节，批量模式用 redirect_stdout 收集输出时同样有效
+    """
+    sys.stdout.write(color + msg + _end)
+
+
+# 所有彩色输出都经过 _emit；固定颜色的函数用 partial 绑定颜色 (C 实现，不多一层 Python 调用)
+print_colored = _emit
+print_info = functools.partial(_emit, color=Colors.CYAN)
+print_success = functools.partial(_emit, color=Colors.GREEN)
+print_warning = functools.partial(_emit, color=Colors.YELLOW)
+print_error = functools.partial(_emit, color=Colors.RED)
+
+
+# 预编译的小端序整数格式
+UINT16 = struct.Struct('<H')
+UINT32 = struct.Struct('<I')
+
+# 资源文件中常用的 UTF-16-LE 字节串
+FILE_VERSION_KEY_U16 = 'FileVersion'.encode('utf-16-le')   # 字符串表中的键名
+DOT_U16 = '.'.encode('utf-16-le')                          # 版本号分隔符
+NUL_U16 = '\0'.encode('utf-16-le')                         # 字符串结束符
+
+# 修改摘要表的表头和分隔线 (固定内容，无需每次 bump 时重新格式化)
+_RES_SUMMARY_HEADER = f"{'文件':<8} {'位置':<12} {'类型':<30} {'原值':<15} {'新值':<15}"
+_RES_SUMMARY_SEP = "-" * 85
+_SUMMARY_HEADER = f"{'文件':<8} {'位置':<16} {'类型':<28} {'原值':<18} {'新值':<18}"
+_SUMMARY_SEP = "-" * 90
+
+
+def find_u16(data: bytes, pattern: bytes, start: int, end: Optional[int] = None) -> int:
+    """在 UTF-16-LE 数据中查找 pattern，只接受与 start 按 2 字节对齐的匹配
+
+    bytes.find 可能匹配到跨越两个字符的位置 (如 '0\\x00' + '\\x00X')，
+    这里跳过这类未对齐的结果。找不到时返回 -1。
+    """
+    if end is None:
+        end = len(data)
+    pos = data.find(pattern, start, end)
+    while pos != -1 and (pos - start) % 2:
+        pos = data.find(pattern, pos + 1, end)
+    return pos
+
+
+def _can_swap_file(real_path: str, backup: str) -> bool:
+    """能否用 "写临时文件 + os.replace" 的方式替换 real_path
+
+    文件还有备份以外的硬链接、或属于其他用户时，换成新 inode 会让其他链接看不到修改、
+    或丢失原属主，这种情况只能在原文件上直接写入 (备份也就不能用硬链接)
+    """
+    st = os.stat(real_path)
+    links = st.st_nlink
+    try:
+        if os.path.samestat(st, os.stat(backup)):
+            links -= 1
+    except OSError:
+        pass
+    if links > 1:
+        return False
+    return not hasattr(os, 'geteuid') or st.st_uid == os.geteuid()
+
+
+def backup_file(path: str) -> str:
+    """备份文件到 <path>.bak，优先使用硬链接 (不复制数据)，不支持时退回复制
+
+    path 是符号链接时备份其指向的实际文件
+    """
+    backup = f"{path}.bak"
+    # os.link 不会覆盖已存在的文件
+    if os.path.lexists(backup):
+        os.remove(backup)
+    real_path = os.path.realpath(path)
+    if _can_swap_file(real_path, backup):
+        try:
+            os.link(real_path, backup)
+            return backup
+        except (OSError, NotImplementedError):
+            pass
+    shutil.copy2(real_path, backup)
+    return backup
+
+
+def replace_file(path: str, data: bytes):
+    """写入新内容：先写临时文件再替换原文件
+
+    不在原 inode 上截断写入，这样硬链接的 .bak 仍保留旧内容。
+    path 是符号链接时替换其指向的实际文件；文件还有其他硬链接或属于其他用户时
+    (此时 backup_file 已改为复制) 直接在原文件上写入
+    """
+    real_path = os.path.realpath(path)
+    if not _can_swap_file(real_path, f"{path}.bak"):
+        with open(real_path, 'wb') as f:
+            f.write(data)
+        return
+
+    st = os.stat(real_path)
+    tmp_file = f"{real_path}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        # 复制权限位、扩展属性 (含 ACL) 等元数据，修改时间仍取当前时间
+        shutil.copystat(real_path, tmp_file)
+        os.utime(tmp_file)
+        if hasattr(os, 'chown') and os.stat(tmp_file).st_gid != st.st_gid:
+            with contextlib.suppress(OSError):
+                os.chown(tmp_file, -1, st.st_gid)
+        os.replace(tmp_file, real_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+
+class VersionBumpError(Exception):
+    """版本号升级失败 (文件缺失、结构无法识别等)，消息不带 "错误: " 前缀"""
+
+
+@dataclass
+class VersionInfo:
+    """版本信息结构: Major.Minor.Build.Release (如 10.2503.6.0)"""
+    major: int
+    minor: int
+    build: int      # 这是我们要修改的版本号
+    release: int    # 通常固定为 0
+    
+    def __str__(self) -> str:
+        return f"{self.major}.{self.minor}.{self.build}.{self.release}"
+    
+    @classmethod
+    def from_string(cls, version_str: str) -> 'VersionInfo':
+        """从字符串解析版本号"""
+        parts = version_str.split('.')
+        if len(parts) == 4:
+            try:
+                return cls(
+                    major=int(parts[0]),
+                    minor=int(parts[1]),
+                    build=int(parts[2]),
+                    release=int(parts[3])
+                )
+            except ValueError:
+                pass
+        raise ValueError(f"版本号格式错误: {version_str}，期望 x.x.x.x 格式")
+
+
+@dataclass
+class ModificationRecord:
+    """修改记录"""
+    file: str       # 文件名
+    location: str   # 位置描述 (偏移或行号)
+    type_desc: str
+    old_value: str
+    new_value: str
+
+
+class DprojVersionBumper:
+    """Delphi .dproj 文件版本号升级器"""
+
+    # 预编译的版本号匹配模式 (直接匹配原始字节，版本相关内容均为 ASCII)
+    _RE_FILEVER = re.compile(rb'FileVersion=(\d+\.\d+\.\d+\.\d+)')
+    _RE_RELEASE = re.compile(rb'<VerInfo_Release>(\d+)</VerInfo_Release>')
+    _RE_MINOR = re.compile(rb'<VerInfo_MinorVer>(\d+)</VerInfo_MinorVer>')
+    
+    def __init__(self, dproj_file: str):
+        self.dproj_file = os.path.abspath(dproj_file)
+        self.content: bytes = b""   # 原始字节，不解码 (保持文件原有编码、BOM 和换行符)
+        self.modifications: List[ModificationRecord] = []
+        self.current_version: Optional[VersionInfo] = None
+        self.new_version: Optional[VersionInfo] = None
+    
+    def load(self):
+        """加载 .dproj 文件"""
+        if not os.path.exists(self.dproj_file):
+            raise VersionBumpError(f"文件不存在 - {self.dproj_file}")
+        
+        with open(self.dproj_file, 'rb') as f:
+            self.content = f.read()
+        
+        if not self.content:
+            raise VersionBumpError(f"无法读取文件 - {self.dproj_file}")
+        
+        print_info(f"目标文件: {self.dproj_file}")
+    
+    def analyze(self):
+        """分析 .dproj 文件中的版本号"""
+        self.load()
+
+        # 查找 FileVersion (必须存在)
+        file_version_match = self._RE_FILEVER.search(self.content)
+        if not file_version_match:
+            raise VersionBumpError("无法找到 FileVersion")
+
+        version_str = file_version_match.group(1).decode('ascii')
+        self.current_version = VersionInfo.from_string(version_str)
+
+        # 查找版本标签 (VerInfo_Release 或 VerInfo_MinorVer，可选)
+        release_match = self._RE_RELEASE.search(self.content)
+        minor_match = self._RE_MINOR.search(self.content)
+
+        print()
+        print_info("=== .dproj 版本信息 ===")
+        if release_match:
+            print(f"  VerInfo_Release: {release_match.group(1).decode('ascii')}")
+        if minor_match:
+            print(f"  VerInfo_MinorVer: {minor_match.group(1).decode('ascii')}")
+        print(f"  FileVersion: {version_str}")
+    
+    def update(self, new_build: int = None, new_minor: int = None):
+        """更新 .dproj 文件中的版本号
+
+        Args:
+            new_build: 新的 Build 号（标准模式）
+            new_minor: 新的 Minor 号（trunk 模式）
+        """
+        if self.current_version is None:
+            raise RuntimeError("未分析版本信息")
+
+        old_build = self.current_version.build
+        old_minor = self.current_version.minor
+
+        # 确定新的版本号
+        target_build = new_build if new_build is not None else old_build
+        target_minor = new_minor if new_minor is not None else old_minor
+
+        # 判断是 trunk 模式还是标准模式
+        is_trunk_mode = new_minor is not None
+
+        if is_trunk_mode:
+            # Trunk 模式：更新 VerInfo_MinorVer
+            tag, old_value, new_value = 'VerInfo_MinorVer', old_minor, target_minor
+        else:
+            # 标准模式：更新 VerInfo_Release (Build 号)
+            tag, old_value, new_value = 'VerInfo_Release', old_build, target_build
+
+        old_tag = f'<{tag}>{old_value}</{tag}>'.encode('ascii')
+        new_tag = f'<{tag}>{new_value}</{tag}>'.encode('ascii')
+
+        # 同时更新 VerInfo_Keys 中的 FileVersion
+        old_file_ver = f"{self.current_version.major}.{old_minor}.{old_build}.{self.current_version.release}"
+        new_file_ver = f"{self.current_version.major}.{target_minor}.{target_build}.{self.current_version.release}"
+
+        old_ver_pattern = f'FileVersion={old_file_ver}'.encode('ascii')
+        new_ver_pattern = f'FileVersion={new_file_ver}'.encode('ascii')
+
+        # 一次扫描同时替换标签和 FileVersion 字符串
+        replacements = {old_tag: new_tag, old_ver_pattern: new_ver_pattern}
+        found = set()
+
+        def replace(match: re.Match) -> bytes:
+            found.add(match.group(0))
+            return replacements[match.group(0)]
+
+        pattern = re.compile(re.escape(old_tag) + b'|' + re.escape(old_ver_pattern))
+        self.content = pattern.sub(replace, self.content)
+
+        if old_tag in found:
+            self.modifications.append(ModificationRecord(
+                file=".dproj",
+                location=tag,
+                type_desc=f"{tag} 标签",
+                old_value=str(old_value),
+                new_value=str(new_value)
+            ))
+
+        if old_ver_pattern in found:
+            self.modifications.append(ModificationRecord(
+                file=".dproj",
+                location="VerInfo_Keys",
+                type_desc="FileVersion 字符串",
+                old_value=old_file_ver,
+                new_value=new_file_ver
+            ))
+    
+    def backup(self):
+        """备份原文件到 .bak"""
+        backup = backup_file(self.dproj_file)
+        print_info(f"已备份原文件到: {backup}")
+    
+    def save(self, backup: bool = True):
+        """保存修改后的文件 (update 已生成新的 content，这里只做备份和写出)"""
+        if backup:
+            self.backup()
+        
+        replace_file(self.dproj_file, self.content)
+
+class ResVersionBumper:
+    """Delphi .res 文件版本号升级器"""
+    
+    # VS_FIXEDFILEINFO 签名 (小端序): 0xFEEF04BD
+    VS_FFI_SIGNATURE = bytes([0xBD, 0x04, 0xEF, 0xFE])
+
+    # 版本字符串长度变化时需要同步的长度字段: (偏移, 差异类型, 描述)
+    # 差异类型: aligned = 按 4 字节对齐后的字节差异 (外层结构)
+    #           byte    = 实际字节差异 (FileVersion 条目本身，不包括外部填充)
+    #           char    = 字符差异 (wValueLength 以字符计)
+    LENGTH_FIELDS = [
+        (0x0020, 'aligned', "资源块 DataSize"),
+        (0x0040, 'aligned', "资源块 DataSize"),     # 副本
+        (0x009C, 'aligned', "StringFileInfo wLength"),
+        (0x00C0, 'aligned', "StringTable wLength"),
+        (0x015C, 'byte', "FileVersion wLength"),
+        (0x015E, 'char', "FileVersion wValueLength"),
+    ]
+    
+    def __init__(self, res_file: str):
+        self.res_file = os.path.abspath(res_file)
+        self.data: bytearray = bytearray()
+        self.modifications: List[ModificationRecord] = []
+        
+        # 关键偏移位置
+        self.ffi_offset: int = -1                    # VS_FIXEDFILEINFO 签名位置
+        self.file_version_ls_offset: int = -1       # FileVersionLS (高16位=Build)
+        self.product_version_ls_offset: int = -1    # ProductVersionLS
+        self.file_version_key_offset: int = -1      # "FileVersion" 键名位置
+        self.file_version_string_offset: int = -1   # FileVersion 字符串位置
+        
+        # 版本信息
+        self.current_version: Optional[VersionInfo] = None
+        self.new_version: Optional[VersionInfo] = None
+    
+    def load(self):
+        """加载 .res 文件"""
+        if not os.path.exists(self.res_file):
+            raise VersionBumpError(f"文件不存在 - {self.res_file}")
+        
+        # 直接读入预分配的 bytearray，避免 bytes -> bytearray 再复制一份
+        with open(self.res_file, 'rb') as f:
+            self.data = bytearray(os.fstat(f.fileno()).st_size)
+            del self.data[f.readinto(self.data):]
+        
+        print_info(f"目标文件: {self.res_file}")
+        print_info(f"文件大小: {len(self.data):,} 字节")
+    
+    def find_binary_version(self):
+        """
+        查找 VS_FIXEDFILEINFO 中的二进制版本号位置
+        
+        VS_FIXEDFILEINFO 结构 (共 52 字节):
+        - dwSignature      (4 bytes): 0xFEEF04BD
+        - dwStrucVersion   (4 bytes)
+        - dwFileVersionMS  (4 bytes): HIWORD=Major, LOWORD=Minor
+        - dwFileVersionLS  (4 bytes): HIWORD=Build, LOWORD=Release  <-- 我们修改 Build
+        - dwProductVersionMS (4 bytes)
+        - dwProductVersionLS (4 bytes)
+        - ...
+        """
+        pos = self.data.find(self.VS_FFI_SIGNATURE)
+        if pos == -1:
+            raise VersionBumpError("无法找到 VS_FIXEDFILEINFO 结构")
+        
+        self.ffi_offset = pos
+        
+        # 计算各字段偏移
+        # FileVersionLS 在签名后 8 字节 (跳过 signature + strucVersion + FileVersionMS)
+        self.file_version_ls_offset = pos + 4 + 4 + 4
+        # ProductVersionLS 在 FileVersionLS 后 8 字节
+        self.product_version_ls_offset = self.file_version_ls_offset + 4 + 4
+        
+        # 读取当前版本号
+        file_ver_ms = UINT32.unpack_from(self.data, pos + 4 + 4)[0]
+        file_ver_ls = UINT32.unpack_from(self.data, self.file_version_ls_offset)[0]
+        
+        major = (file_ver_ms >> 16) & 0xFFFF
+        minor = file_ver_ms & 0xFFFF
+        build = (file_ver_ls >> 16) & 0xFFFF   # 高16位是 Build
+        release = file_ver_ls & 0xFFFF          # 低16位是 Release
+        
+        print()
+        print_info("=== 二进制版本信息 (VS_FIXEDFILEINFO) ===")
+        print(f"  签名位置: 0x{pos:X}")
+        print(f"  FileVersionLS 偏移: 0x{self.file_version_ls_offset:X}")
+        print(f"  二进制版本: {major}.{minor}.{build}.{release}")
+    
+    def find_string_version(self):
+        """查找 FileVersion 字符串版本号"""
+        # 搜索 "FileVersion" Unicode 字符串
+        pos = self.data.find(FILE_VERSION_KEY_U16)
+        
+        if pos == -1:
+            raise VersionBumpError("无法找到 FileVersion 字符串")
+        
+        self.file_version_key_offset = pos
+        
+        # FileVersion 后跟 null terminator，然后是版本值字符串
+        search_start = pos + len(FILE_VERSION_KEY_U16) + len(NUL_U16)
+        
+        # 跳过填充字节
+        while search_start < len(self.data) and self.data[search_start] == 0:
+            search_start += 1
+        
+        self.file_version_string_offset = search_start
+        
+        # 版本字符串不会超出 FileVersion 条目本身
+        # (条目头在 key 前面 6 字节，第一个字段 wLength 为条目总长度)
+        entry_end = len(self.data)
+        if pos >= 6:
+            entry_end = min(entry_end, pos - 6 + UINT16.unpack_from(self.data, pos - 6)[0])
+        if entry_end < search_start:
+            entry_end = len(self.data)
+        entry_end = search_start + (entry_end - search_start) // 2 * 2
+
+        # 读取版本字符串 (到 null terminator 为止，只在条目范围内查找)
+        string_end = find_u16(self.data, NUL_U16, search_start, entry_end)
+        if string_end == -1:
+            string_end = entry_end
+
+        # 文件内容损坏时解码或解析都可能失败 (UnicodeDecodeError 也是 ValueError)
+        try:
+            version_string = self.data[search_start:string_end].decode('utf-16-le')
+            self.current_version = VersionInfo.from_string(version_string)
+        except ValueError as e:
+            raise VersionBumpError(f"无法解析 FileVersion 字符串 - {e}") from e
+        
+        print()
+        print_info("=== 字符串版本信息 (FileVersion) ===")
+        print(f"  偏移地址: 0x{self.file_version_string_offset:X}")
+        print(f"  当前版本: {version_string}")
+        print(f"  解析: Major={self.current_version.major}, Minor={self.current_version.minor}, "
+              f"Build={self.current_version.build}, Release={self.current_version.release}")
+    
+    def analyze(self):
+        """分析 .res 文件"""
+        self.load()
+        self.find_binary_version()
+        self.find_string_version()
+    
+    def calculate_new_version(self, new_build: Optional[int] = None,
+                               new_minor: Optional[int] = None) -> VersionInfo:
+        """计算新版本号 (修改 Build 或 Minor 字段)
+
+        Args:
+            new_build: 新的 Build 号（标准模式）
+            new_minor: 新的 Minor 号（trunk 模式）
+        """
+        if self.current_version is None:
+            raise RuntimeError("未分析版本信息")
+
+        # 确定目标版本号
+        target_build = new_build if new_build is not None else self.current_version.build
+        target_minor = new_minor if new_minor is not None else self.current_version.minor
+
+        # 如果都没指定，默认 build +1
+        if new_build is None and new_minor is None:
+            target_build = self.current_version.build + 1
+
+        self.new_version = VersionInfo(
+            major=self.current_version.major,
+            minor=target_minor,
+            build=target_build,
+            release=self.current_version.release
+        )
+
+        return self.new_version
+    
+    def update_binary_version(self):
+        """更新二进制版本号
+
+        VS_FIXEDFILEINFO 结构中：
+        - FileVersionMS (4 bytes): HIWORD=Major, LOWORD=Minor
+        - FileVersionLS (4 bytes): HIWORD=Build, LOWORD=Release
+        """
+        if self.new_version is None:
+            raise RuntimeError("未计算新版本号")
+
+        # 检查是否需要更新 Minor（trunk 模式）
+        if self.current_version.minor != self.new_version.minor:
+            # Minor 在 FileVersionMS 的低16位
+            # FileVersionMS 偏移: ffi_offset + 4 (signature) + 4 (strucVersion)
+            file_version_ms_offset = self.ffi_offset + 4 + 4
+            minor_offset = file_version_ms_offset  # 小端序，低16位在前
+
+            old_bytes = self.data[minor_offset:minor_offset + 2]
+            old_value = f"0x{old_bytes[1]:02X}{old_bytes[0]:02X} ({UINT16.unpack_from(self.data, minor_offset)[0]})"
+
+            # 写入新的 Minor 值
+            UINT16.pack_into(self.data, minor_offset, self.new_version.minor)
+
+            new_bytes = self.data[minor_offset:minor_offset + 2]
+            new_value = f"0x{new_bytes[1]:02X}{new_bytes[0]:02X} ({self.new_version.minor})"
+
+            self.modifications.append(ModificationRecord(
+                file=".res",
+                location=f"0x{minor_offset:X}",
+                type_desc="FileVersionMS.Minor (二进制)",
+                old_value=old_value,
+                new_value=new_value
+            ))
+
+        # 检查是否需要更新 Build（标准模式）
+        if self.current_version.build != self.new_version.build:
+            new_build = self.new_version.build
+
+            # FileVersionLS: 高16位是 Build，低16位是 Release
+            # 偏移 +2 是 Build 所在的位置 (因为是小端序，低字节在前)
+            build_offset = self.file_version_ls_offset + 2
+
+            old_bytes = self.data[build_offset:build_offset + 2]
+            old_value = f"0x{old_bytes[1]:02X}{old_bytes[0]:02X} ({UINT16.unpack_from(self.data, build_offset)[0]})"
+
+            # 写入新的 Build 值
+            UINT16.pack_into(self.data, build_offset, new_build)
+
+            new_bytes = self.data[build_offset:build_offset + 2]
+            new_value = f"0x{new_bytes[1]:02X}{new_bytes[0]:02X} ({new_build})"
+
+            self.modifications.append(ModificationRecord(
+                file=".res",
+                location=f"0x{build_offset:X}",
+                type_desc="FileVersionLS.Build (二进制)",
+                old_value=old_value,
+                new_value=new_value
+            ))
+    
+    def update_string_version(self):
+        """更新字符串版本号 (支持 Build 和 Minor 的跨位数升级)"""
+        if self.current_version is None or self.new_version is None:
+            raise RuntimeError("版本信息未初始化")
+
+        # 判断是更新 Minor 还是 Build
+        is_minor_changed = self.current_version.minor != self.new_version.minor
+        is_build_changed = self.current_version.build != self.new_version.build
+
+        if is_minor_changed:
+            # Trunk 模式：更新 Minor
+            old_minor_str = str(self.current_version.minor)
+            new_minor_str = str(self.new_version.minor)
+            len_diff = len(new_minor_str) - len(old_minor_str)
+
+            if len_diff == 0:
+                self._update_string_version_minor_same_length(old_minor_str, new_minor_str)
+            else:
+                self._update_string_version_minor_diff_length(old_minor_str, new_minor_str, len_diff)
+        elif is_build_changed:
+            # 标准模式：更新 Build
+            old_build_str = str(self.current_version.build)
+            new_build_str = str(self.new_version.build)
+            len_diff = len(new_build_str) - len(old_build_str)
+
+            if len_diff == 0:
+                self._update_string_version_same_length(old_build_str, new_build_str)
+            else:
+                self._update_string_version_diff_length(old_build_str, new_build_str, len_diff)
+        else:
+            print_warning("警告: 版本号未发生变化")
+
+    def _find_version_field(self, index: int) -> int:
+        """返回 FileVersion 字符串中第 index 段 (0=Major, 1=Minor, 2=Build) 的起始偏移
+
+        逐个查找 '.' 分隔符 (UTF-16-LE)，到 null terminator 为止；找不到返回 -1
+        """
+        pos = self.file_version_string_offset
+        string_end = find_u16(self.data, NUL_U16, pos)
+        if string_end == -1:
+            string_end = len(self.data)
+
+        for _ in range(index):
+            dot = find_u16(self.data, DOT_U16, pos, string_end)
+            if dot == -1:
+                return -1
+            pos = dot + 2
+        return pos
+
+    def _update_string_version_minor_same_length(self, old_minor_str: str, new_minor_str: str):
+        """更新 Minor 字符串版本号 (长度相同)"""
+        # 在版本字符串中找到 Minor 部分的位置（第一个点之后）
+        minor_str_offset = self._find_version_field(1)
+
+        if minor_str_offset == -1:
+            raise VersionBumpError("无法定位 Minor 字符串位置")
+
+        # 更新 Minor 字符串
+        self.data[minor_str_offset:minor_str_offset + len(new_minor_str) * 2] = new_minor_str.encode('utf-16-le')
+
+        self.modifications.append(ModificationRecord(
+            file=".res",
+            location=f"0x{minor_str_offset:X}",
+            type_desc="FileVersion 字符串 (Minor)",
+            old_value=old_minor_str,
+            new_value=new_minor_str
+        ))
+
+        # 更新所有其他版本字符串
+        self._update_all_version_strings_for_minor(old_minor_str, new_minor_str)
+    
+    def _update_string_version_minor_diff_length(self, old_minor_str: str, new_minor_str: str, len_diff: int):
+        """更新 Minor 字符串版本号 (长度不同)"""
+        byte_diff = len_diff * 2
+        aligned_byte_diff = ((byte_diff + 3) // 4) * 4
+
+        print_info(f"  Minor 长度变化: {len(old_minor_str)} -> {len(new_minor_str)} (字节差异: {byte_diff:+d})")
+
+        # 使用完整版本号替换策略
+        old_version = str(self.current_version)
+        new_version = str(self.new_version)
+
+        old_pattern = old_version.encode('utf-16-le')
+        new_pattern = new_version.encode('utf-16-le')
+
+        # 查找所有匹配位置
+        positions = []
+        pos = 0
+        while True:
+            pos = self.data.find(old_pattern, pos)
+            if pos == -1:
+                break
+            positions.append(pos)
+            pos += len(old_pattern)
+
+        if not positions:
+            raise VersionBumpError("无法找到版本字符串进行替换")
+
+        self._replace_at(positions, len(old_pattern), new_pattern)
+
+        self.modifications.append(ModificationRecord(
+            file=".res",
+            location="多处",
+            type_desc="版本字符串 (Minor)",
+            old_value=old_version,
+            new_value=new_version
+        ))
+
+        # 更新长度字段
+        self._update_length_fields(byte_diff, aligned_byte_diff, 0)
+
+        print_info(f"  (共更新 {len(positions)} 处版本字符串)")
+    
+    def _update_all_version_strings_for_minor(self, old_minor: str, new_minor: str):
+        """更新文件中所有的 Minor 版本字符串 (长度相同时)"""
+        # 构建完整版本号的搜索模式进行替换
+        old_version = str(self.current_version)
+        new_version = str(self.new_version)
+
+        old_pattern = old_version.encode('utf-16-le')
+        new_pattern = new_version.encode('utf-16-le')
+
+        # 长度相同，一次 replace 即可完成全部替换
+        count = self.data.count(old_pattern)
+        if count:
+            self.data = self.data.replace(old_pattern, new_pattern)
+
+        if count > 1:
+            print_info(f"  (共更新 {count} 处版本字符串)")
+    
+    def _update_string_version_same_length(self, old_build_str: str, new_build_str: str):
+        """更新字符串版本号 (长度相同)"""
+        # 在版本字符串中找到 Build 部分的位置（第二个点之后）
+        build_str_offset = self._find_version_field(2)
+        
+        if build_str_offset == -1:
+            raise VersionBumpError("无法定位 Build 字符串位置")
+        
+        # 更新 Build 字符串
+        self.data[build_str_offset:build_str_offset + len(new_build_str) * 2] = new_build_str.encode('utf-16-le')
+        
+        self.modifications.append(ModificationRecord(
+            file=".res",
+            location=f"0x{build_str_offset:X}",
+            type_desc="FileVersion 字符串 (Build)",
+            old_value=old_build_str,
+            new_value=new_build_str
+        ))
+        
+        # 更新所有其他版本字符串
+        self._update_all_version_strings(old_build_str, new_build_str)
+    
+    def _update_string_version_diff_length(self, old_build_str: str, new_build_str: str, len_diff: int):
+        """更新字符串版本号 (长度不同，需要调整结构)"""
+        # 字节差异 = 字符差异 * 2 (UTF-16-LE)
+        byte_diff = len_diff * 2
+        
+        # Windows 资源文件需要 4 字节对齐，计算对齐后的总字节差异
+        # FileVersion 条目的 wLength 只增加实际的字节数
+        # 但外层结构需要按 4 字节对齐
+        aligned_byte_diff = ((byte_diff + 3) // 4) * 4  # 向上取整到 4 的倍数
+        
+        print_info(f"  版本号长度变化: {len(old_build_str)} -> {len(new_build_str)} (字节差异: {byte_diff:+d}, 对齐后: {aligned_byte_diff:+d})")
+        
+        # 1. FileVersion 字符串条目的位置 (analyze 时已定位，之前的修改不改变其偏移)
+        # FileVersion 条目头在 key 前面 6 字节 (wLength + wValueLength + wType)
+        fv_entry_offset = self.file_version_key_offset - 6
+        
+        # 2. 读取当前的长度值
+        fv_wLength = UINT16.unpack_from(self.data, fv_entry_offset)[0]
+        fv_wValueLength = UINT16.unpack_from(self.data, fv_entry_offset + 2)[0]
+        
+        # 3. 找到 Build 数字的起始位置（第二个点之后）
+        build_str_offset = self._find_version_field(2)
+        
+        if build_str_offset == -1:
+            raise VersionBumpError("无法定位 Build 字符串位置")
+        
+        # 找到 Build 数字的结束位置 (下一个点或字符串结束)
+        string_end = find_u16(self.data, NUL_U16, build_str_offset)
+        if string_end == -1:
+            string_end = build_str_offset + (len(self.data) - build_str_offset) // 2 * 2
+        build_end_offset = find_u16(self.data, DOT_U16, build_str_offset, string_end)
+        if build_end_offset == -1:
+            build_end_offset = string_end
+        
+        # 4. 找到 FileVersion 条目的结束位置（当前条目结束后下一个条目开始处）
+        # FileVersion 条目结束于 fv_entry_offset + fv_wLength
+        fv_entry_end = fv_entry_offset + fv_wLength
+        
+        # 5. 构建新的 Build 字符串字节
+        new_build_bytes = new_build_str.encode('utf-16-le')
+        
+        # 6. 执行替换：替换 Build 部分 (原地修改，不重建整个缓冲区)
+        self.data[build_str_offset:build_end_offset] = new_build_bytes
+        
+        self.modifications.append(ModificationRecord(
+            file=".res",
+            location=f"0x{build_str_offset:X}",
+            type_desc="FileVersion 字符串 (Build)",
+            old_value=old_build_str,
+            new_value=new_build_str
+        ))
+        
+        # 7. 计算并插入填充字节（保持 4 字节对齐）
+        # 新的 FileVersion 条目结束位置
+        new_fv_entry_end = fv_entry_offset + fv_wLength + byte_diff
+        # 需要的填充字节数（使下一个条目 4 字节对齐）
+        padding_needed = aligned_byte_diff - byte_diff
+        
+        if padding_needed > 0:
+            # 在当前条目结束位置插入填充字节
+            # 由于已经插入了 byte_diff 字节，FileVersion 条目现在结束于新位置
+            # 找到字符串值的结束位置（null terminator 之后）
+            # 新的字符串结束位置 = 原始结束位置 + byte_diff
+            string_end_offset = fv_entry_end + byte_diff
+            
+            # 插入填充字节
+            self.data[string_end_offset:string_end_offset] = bytes(padding_needed)
+        
+        # 8. 更新所有长度字段
+        self._update_length_fields(byte_diff, aligned_byte_diff, fv_entry_offset)
+        
+        # 9. 更新所有其他版本字符串 (ProductVersion 等)
+        self._update_all_version_strings_with_length_change(old_build_str, new_build_str)
+    
+    def _update_length_fields(self, byte_diff: int, aligned_byte_diff: int, fv_entry_offset: int):
+        """更新所有相关的长度字段 (见 LENGTH_FIELDS)"""
+        deltas = {
+            'aligned': aligned_byte_diff,
+            'byte': byte_diff,
+            'char': byte_diff // 2,     # wValueLength 是字符数，不是字节数
+        }
+
+        for offset, kind, type_desc in self.LENGTH_FIELDS:
+            if offset >= len(self.data) - 2:
+                continue
+            old_val = UINT16.unpack_from(self.data, offset)[0]
+            new_val = old_val + deltas[kind]
+            UINT16.pack_into(self.data, offset, new_val)
+            self.modifications.append(ModificationRecord(
+                file=".res",
+                location=f"0x{offset:04X}",
+                type_desc=type_desc,
+                old_value=str(old_val),
+                new_value=str(new_val)
+            ))
+    
+    def _update_all_version_strings(self, old_build: str, new_build: str):
+        """更新文件中所有的版本字符串 (长度相同时)"""
+        # 构建搜索模式: ".X." (Unicode)，X 是 build 号
+        old_pattern = f".{old_build}.".encode('utf-16-le')
+        new_pattern = f".{new_build}.".encode('utf-16-le')
+        
+        # 长度相同，一次 replace 即可完成全部替换
+        count = self.data.count(old_pattern)
+        if count:
+            self.data = self.data.replace(old_pattern, new_pattern)
+        
+        if count > 1:
+            print_info(f"  (共更新 {count} 处版本字符串)")
+    
+    def _update_all_version_strings_with_length_change(self, old_build: str, new_build: str):
+        """更新文件中所有的版本字符串 (长度不同时，逐个查找替换)"""
+        # 构建完整版本号的搜索模式
+        old_version = f"{self.current_version.major}.{self.current_version.minor}.{old_build}.{self.current_version.release}"
+        new_version = f"{self.new_version.major}.{self.new_version.minor}.{new_build}.{self.new_version.release}"
+        
+        old_pattern = old_version.encode('utf-16-le')
+        new_pattern = new_version.encode('utf-16-le')
+        
+        byte_diff = len(new_pattern) - len(old_pattern)
+        
+        # 查找所有匹配位置
+        positions = []
+        pos = 0
+        while True:
+            pos = self.data.find(old_pattern, pos)
+            if pos == -1:
+                break
+            positions.append(pos)
+            pos += len(old_pattern)
+        
+        # 跳过第一个 FileVersion (已经处理过)
+        self._replace_at(positions[1:], len(old_pattern), new_pattern)
+        
+        if len(positions) > 1:
+            print_info(f"  (共更新 {len(positions)} 处版本字符串)")
+    
+    def _replace_at(self, positions: List[int], old_len: int, new_pattern: bytes):
+        """将 positions (升序) 处长度为 old_len 的内容替换为 new_pattern
+
+        长度不同时逐个替换会反复搬移整个缓冲区，这里一次拼接生成新数据
+        """
+        if not positions:
+            return
+
+        with memoryview(self.data) as view:
+            parts = []
+            cursor = 0
+            for pos in positions:
+                parts.append(view[cursor:pos])
+                parts.append(new_pattern)
+                cursor = pos + old_len
+            parts.append(view[cursor:])
+            data = bytearray().join(parts)
+        self.data = data
+    
+    def backup(self):
+        """备份原文件到 .bak"""
+        backup = backup_file(self.res_file)
+        print_info(f"已备份原文件到: {backup}")
+    
+    def save(self, backup: bool = True):
+        """保存修改后的文件 (update_* 已就地修改 data，这里只做备份和写出)"""
+        if backup:
+            self.backup()
+        
+        replace_file(self.res_file, self.data)
+    
+    def print_summary(self):
+        """打印修改摘要"""
+        print()
+        print_info("=== 修改摘要 ===")
+        # 整张表拼好后一次写出
+        lines = [_RES_SUMMARY_HEADER, _RES_SUMMARY_SEP]
+        lines.extend(f"{mod.file:<8} {mod.location:<12} {mod.type_desc:<30} {mod.old_value:<15} {mod.new_value:<15}"
+                     for mod in self.modifications)
+        sys.stdout.write('\n'.join(lines) + '\n')
+    
+    def bump(self, new_build: Optional[int] = None, dry_run: bool = False):
+        """
+        执行版本号升级
+        
+        Args:
+            new_build: 指定新的 Build 号，None 表示自动 +1
+            dry_run: 预览模式，不实际保存文件
+        """
+        print()
+        print_colored("=" * 55, Colors.HEADER)
+        print_colored("   Delphi .res 版本号升级工具 v1.0", Colors.HEADER)
+        print_colored("=" * 55, Colors.HEADER)
+        print()
+        
+        # 1. 分析文件
+        self.analyze()
+        
+        # 2. 计算新版本号
+        self.calculate_new_version(new_build)
+        
+        if self.new_version == self.current_version:
+            print()
+            print_info(f"版本号未变化 ({self.current_version})，跳过")
+            print()
+            return
+        
+        print()
+        print_success("=== 版本号变更 ===")
+        print(f"  当前版本: {Colors.YELLOW}{self.current_version}{Colors.ENDC}")
+        print(f"  新版本:   {Colors.GREEN}{self.new_version}{Colors.ENDC}")
+        
+        if dry_run:
+            print()
+            print_warning("[预览模式] 以下修改将被执行但不会保存:")
+        
+        # 3. 执行修改
+        self.update_binary_version()
+        self.update_string_version()
+        
+        # 4. 显示摘要
+        self.print_summary()
+        
+        # 5. 保存文件
+        if not dry_run:
+            self.save()
+            print()
+            print_success("=" * 55)
+            print_success(f"  ✓ 版本号已从 {self.current_version} 升级到 {self.new_version}")
+            print_success("=" * 55)
+        else:
+            print()
+            print_warning("[预览模式] 未保存任何更改")
+        
+        print()
+
+
+class ProjectVersionBumper:
+    """Delphi 项目版本号升级器 (同时处理 .res 和 .dproj 文件)"""
+
+    def __init__(self, project_dir: str):
+        self.project_dir = os.path.abspath(project_dir)
+        self.res_file: Optional[str] = None
+        self.dproj_file: Optional[str] = None
+        self.res_basename: Optional[str] = None     # 文件名 (不含目录)，find_files 时确定
+        self.dproj_basename: Optional[str] = None
+        self.res_bumper: Optional[ResVersionBumper] = None
+        self.dproj_bumper: Optional[DprojVersionBumper] = None
+        self.current_version: Optional[VersionInfo] = None
+        self.new_version: Optional[VersionInfo] = None
+        self.trunk_mode: bool = False  # trunk 模式：升级 Minor 版本号
+    
+    def find_files(self):
+        """查找项目中的 .res 和 .dproj 文件"""
+        if os.path.isfile(self.project_dir):
+            # 如果传入的是文件，获取其目录
+            self.project_dir = os.path.dirname(self.project_dir)
+        
+        if not os.path.isdir(self.project_dir):
+            raise VersionBumpError(f"目录不存在 - {self.project_dir}")
+        
+        # 查找 .res 和 .dproj 文件 (scandir 自带文件类型信息，无需逐个 stat)
+        with os.scandir(self.project_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name = entry.name.lower()
+                if name.endswith('.res') and self.res_file is None:
+                    self.res_file = entry.path
+                    self.res_basename = entry.name
+                elif name.endswith('.dproj') and self.dproj_file is None:
+                    self.dproj_file = entry.path
+                    self.dproj_basename = entry.name
+                if self.res_file and self.dproj_file:
+                    break
+        
+        if not self.res_file:
+            raise VersionBumpError(f"在 {self.project_dir} 中找不到 .res 文件")
+        
+        if not self.dproj_file:
+            raise VersionBumpError(f"在 {self.project_dir} 中找不到 .dproj 文件")
+        
+        print_info(f"项目目录: {self.project_dir}")
+        print_info(f"资源文件: {self.res_basename}")
+        print_info(f"项目文件: {self.dproj_basename}")
+    
+    def _save_all(self):
+        """保存 .res 和 .dproj 文件
+
+        先完成两个文件的备份再统一写入，任一备份失败时两个文件都不会被修改；
+        每个文件的新内容一次性写出
+        """
+        bumpers = (self.res_bumper, self.dproj_bumper)
+
+        for bumper in bumpers:
+            bumper.backup()
+
+        for bumper in bumpers:
+            bumper.save(backup=False)
+    
+    def bump(self, new_build: Optional[int] = None, new_minor: Optional[int] = None,
+             dry_run: bool = False, quiet: bool = False):
+        """
+        执行版本号升级
+
+        Args:
+            new_build: 指定新的 Build 号，None 表示自动 +1
+            new_minor: 指定新的 Minor 号（trunk 模式），None 表示自动 +1
+            dry_run: 预览模式，不实际保存文件
+            quiet: 不输出修改摘要表
+        """
+        print()
+        print_colored("=" * 60, Colors.HEADER)
+        print_colored("     Delphi 版本号升级工具 v2.1", Colors.HEADER)
+        print_colored("     同时更新 .res 和 .dproj 文件", Colors.HEADER)
+        print_colored("=" * 60, Colors.HEADER)
+        print()
+        
+        # 1. 查找文件
+        self.find_files()
+        
+        # 2. 初始化处理器
+        self.res_bumper = ResVersionBumper(self.res_file)
+        self.dproj_bumper = DprojVersionBumper(self.dproj_file)
+        
+        # 3. 分析 .res 文件
+        print()
+        print_colored(">>> 分析 .res 文件", Colors.BLUE)
+        self.res_bumper.analyze()
+        
+        # 4. 分析 .dproj 文件
+        print()
+        print_colored(">>> 分析 .dproj 文件", Colors.BLUE)
+        self.dproj_bumper.analyze()
+        
+        # 5. 验证版本号一致性
+        res_ver = self.res_bumper.current_version
+        dproj_ver = self.dproj_bumper.current_version
+        
+        if res_ver.build != dproj_ver.build:
+            print_warning(f"警告: .res ({res_ver}) 和 .dproj ({dproj_ver}) 版本号不一致!")
+
+        self.current_version = res_ver
+
+        # 6. 计算新版本号
+        # 判断是否为 trunk 模式（升级 Minor 版本号）
+        if new_minor is not None or self.trunk_mode:
+            # trunk 模式：升级 Minor 版本号
+            if new_minor is None:
+                new_minor = self.current_version.minor + 1
+            self.new_version = VersionInfo(
+                major=self.current_version.major,
+                minor=new_minor,
+                build=self.current_version.build,
+                release=self.current_version.release
+            )
+            print_info(f"  [Trunk 模式] 升级 Minor 版本号: {self.current_version.minor} -> {new_minor}")
+        else:
+            # 标准模式：升级 Build 版本号
+            if new_build is None:
+                new_build = self.current_version.build + 1
+            self.new_version = VersionInfo(
+                major=self.current_version.major,
+                minor=self.current_version.minor,
+                build=new_build,
+                release=self.current_version.release
+            )
+        
+        # 两个文件都已是目标版本时无需修改，也不产生备份
+        if self.new_version == res_ver and self.new_version == dproj_ver:
+            print()
+            print_info(f"版本号未变化 ({self.current_version})，跳过")
+            print()
+            return
+        
+        self.res_bumper.new_version = self.new_version
+        self.dproj_bumper.new_version = self.new_version
+        
+        print()
+        print_success("=" * 60)
+        print_success(f"  版本号变更: {Colors.YELLOW}{self.current_version}{Colors.ENDC} -> {Colors.GREEN}{self.new_version}{Colors.ENDC}")
+        print_success("=" * 60)
+        
+        if dry_run:
+            print()
+            print_warning("[预览模式] 以下修改将被执行但不会保存:")
+        
+        # 7. 执行修改
+        print()
+        print_colored(">>> 更新 .res 文件", Colors.BLUE)
+        self.res_bumper.update_binary_version()
+        self.res_bumper.update_string_version()
+        
+        print()
+        print_colored(">>> 更新 .dproj 文件", Colors.BLUE)
+        # 根据模式选择更新参数
+        if new_minor is not None or self.trunk_mode:
+            self.dproj_bumper.update(new_minor=self.new_version.minor)
+        else:
+            self.dproj_bumper.update(new_build=self.new_version.build)
+        
+        # 8. 汇总所有修改 (quiet 时跳过整张表的格式化)
+        if not quiet:
+            all_modifications = itertools.chain(self.res_bumper.modifications, self.dproj_bumper.modifications)
+            
+            print()
+            print_info("=== 修改摘要 ===")
+            # 整张表拼好后一次写出
+            lines = [_SUMMARY_HEADER, _SUMMARY_SEP]
+            lines.extend(f"{mod.file:<8} {mod.location:<16} {mod.type_desc:<28} {mod.old_value:<18} {mod.new_value:<18}"
+                         for mod in all_modifications)
+            sys.stdout.write('\n'.join(lines) + '\n')
+        
+        # 9. 保存文件
+        if not dry_run:
+            print()
+            self._save_all()
+            
+            print()
+            banner = [
+                "=" * 60,
+                f"  ✓ 版本号已从 {self.current_version} 升级到 {self.new_version}",
+                "  ✓ 已更新文件:",
+                f"      - {self.res_basename}",
+                f"      - {self.dproj_basename}",
+                "=" * 60,
+            ]
+            # 每行单独着色，整块一次写出
+            _emit(f"{Colors.ENDC}\n{Colors.GREEN}".join(banner), Colors.GREEN)
+        else:
+            print()
+            print_warning("[预览模式] 未保存任何更改")
+        
+        print()
+
+
+def bump_project(project_path: str, new_build: Optional[int] = None,
+                 new_minor: Optional[int] = None, trunk_mode: bool = False,
+                 dry_run: bool = False, quiet: bool = False):
+    """升级单个项目的版本号，失败时抛出 VersionBumpError"""
+    bumper = ProjectVersionBumper(project_path)
+    bumper.trunk_mode = trunk_mode
+    bumper.bump(new_build=new_build, new_minor=new_minor, dry_run=dry_run, quiet=quiet)
+
+
+def _bump_batch_item(project_path: str, bump_kwargs: dict, capture: bool) -> Tuple[bool, str]:
+    """批量模式中处理单个项目，出错时不中断整个批次
+
+    capture 为 True 时 (并行模式) 收集该项目的输出一并返回，避免多个进程的输出交错
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output) if capture else contextlib.nullcontext():
+        try:
+            bump_project(project_path, **bump_kwargs)
+            success = True
+        except Exception as e:
+            print_error(f"错误: {project_path} - {e}")
+            success = False
+    return success, output.getvalue()
+
+
+def read_batch_file(batch_file: str) -> List[str]:
+    """读取批量模式的项目列表 (每行一个路径，忽略空行和 # 注释，'-' 表示标准输入)"""
+    if batch_file == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(batch_file, 'r', encoding='utf-8-sig') as f:
+            lines = f.read().splitlines()
+
+    paths = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            paths.append(line)
+    return paths
+
+
+def bump_batch(project_paths: List[str], jobs: int = 1, **bump_kwargs) -> bool:
+    """
+    在同一个进程 (或进程池) 中批量升级多个项目
+
+    Args:
+        project_paths: 项目目录列表
+        jobs: 并行进程数，1 表示逐个处理
+        bump_kwargs: 传给 bump_project 的参数
+
+    Returns:
+        是否全部成功
+    """
+    results: List[Tuple[str, bool]] = []
+
+    # 同一项目在列表中出现多次时只处理一次 (否则会重复升级，并行时还会同时写同一个文件)
+    unique_paths = {}
+    for path in project_paths:
+        unique_paths.setdefault(os.path.abspath(path), path)
+    project_paths = list(unique_paths.values())
+
+    if jobs > 1:
+        # 各项目的 .res/.dproj 互不相关，可以并行处理
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_bump_batch_item, path, bump_kwargs, True)
+                       for path in project_paths]
+            for path, future in zip(project_paths, futures):
+                success, output = future.result()
+                sys.stdout.write(output)
+                results.append((path, success))
+    else:
+        for path in project_paths:
+            success, _ = _bump_batch_item(path, bump_kwargs, False)
+            results.append((path, success))
+
+    failed = [path for path, success in results if not success]
+
+    print()
+    print_colored("=" * 60, Colors.HEADER)
+    print_colored(f"  批量处理完成: {len(results) - len(failed)}/{len(results)} 个项目成功", Colors.HEADER)
+    for path in failed:
+        print_error(f"  ✗ {path}")
+    print_colored("=" * 60, Colors.HEADER)
+
+    return not failed